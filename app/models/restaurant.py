@@ -2,12 +2,12 @@
 
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import uuid
 from livekit.agents import Agent
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MenuItem:
     """Restaurant menu item with Firebase document structure"""
     id: str
@@ -17,19 +17,20 @@ class MenuItem:
     category: str
     available: bool = True
     prep_time_minutes: int = 15
-    allergens: List[str] = None
+    allergens: Tuple[str, ...] = ()
     image_url: str = ""
     created_at: datetime = None
     
     def __post_init__(self):
-        if self.allergens is None:
-            self.allergens = []
+        # Frozen, so normalise fields via object.__setattr__
+        object.__setattr__(self, 'allergens', tuple(self.allergens or ()))
         if self.created_at is None:
-            self.created_at = datetime.now()
+            object.__setattr__(self, 'created_at', datetime.now())
     
     def to_dict(self) -> Dict:
         """Convert to Firebase-compatible dictionary"""
         data = asdict(self)
+        data['allergens'] = list(self.allergens)
         data['created_at'] = self.created_at
         return data
     
@@ -1,17 +1,31 @@
 
 
 import logging
+from typing import Final, Optional
 from app.models.restaurant import UserData
 from manager import FirebaseManager
 
-from livekit.plugins import openai, silero, deepgram, cartesia
+from livekit.plugins import silero
 from livekit.agents import Agent, function_tool, RunContext, ChatContext, ChatMessage, get_job_context
 from livekit import api
 from config import AgentConfig
 from shared_tools import update_customer_name, update_customer_phone, update_customer_email, add_special_instructions, get_customer_summary, check_loyalty_status
+from shared_tools import PHONE_SEARCH_RE, EMAIL_SEARCH_RE, PHONE_RE, EMAIL_RE
 
 logger = logging.getLogger(__name__)
 
+# Silero VAD model shared by every session in this process
+_vad: Optional[silero.VAD] = None
+
+
+def get_vad() -> silero.VAD:
+    """Load the VAD model once per process and reuse it across calls"""
+    global _vad
+    if _vad is None:
+        _vad = silero.VAD.load()
+    return _vad
+
+
 class BaseRestaurantAgent(Agent):
     """Base agent that knows how to update and check user data"""
 
@@ -20,19 +34,10 @@ class BaseRestaurantAgent(Agent):
         self.userdata = userdata
         self.config = config
         
-        # Configure agent with STT, LLM, TTS, VAD and shared tools
+        # STT, LLM, TTS and VAD come from the AgentSession so every handoff reuses
+        # the same call-scoped clients; agents only add the shared tools
         super().__init__(
             chat_ctx=chat_ctx,
-            stt=deepgram.STT(api_key=config.deepgram_api_key),
-            llm=openai.LLM(
-                model=config.openai_model,
-                api_key=config.openai_api_key
-            ),
-            tts=cartesia.TTS(
-                api_key=config.cartesia_api_key,
-                voice=config.cartesia_voice_id
-            ),
-            vad=silero.VAD.load(),
             tools=[
                 update_customer_name,
                 update_customer_phone, 
@@ -148,13 +153,11 @@ class BaseRestaurantAgent(Agent):
 
     async def _lookup_customer_info(self, message_text: str) -> str:
         """Look up customer information from Firebase based on message content"""
-        import re
-        
         # Extract phone numbers from message
-        phone_matches = re.findall(r'(\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4})', message_text)
+        phone_matches = PHONE_SEARCH_RE.findall(message_text)
         
         # Extract email addresses from message
-        email_matches = re.findall(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', message_text)
+        email_matches = EMAIL_SEARCH_RE.findall(message_text)
         
         info_parts = []
         
@@ -185,16 +188,11 @@ class BaseRestaurantAgent(Agent):
 
     async def _validate_phone(self, phone: str) -> bool:
         """Validate phone number format"""
-        import re
-        # Simple phone validation - adjust pattern as needed
-        phone_pattern = r'^\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}$'
-        return bool(re.match(phone_pattern, phone.strip()))
+        return bool(PHONE_RE.match(phone.strip()))
 
     async def _validate_email(self, email: str) -> bool:
         """Validate email format"""
-        import re
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, email.strip()))
+        return bool(EMAIL_RE.match(email.strip()))
 
     def _handoff_if_done(self):
         # Default: no handoff, override in child if needed
@@ -208,6 +206,24 @@ class BaseRestaurantAgent(Agent):
         await job_ctx.api.room.delete_room(api.DeleteRoomRequest(room=job_ctx.room.name))
 
 
+# Static instruction text around the menu, kept byte-identical across calls
+_INTENT_PROMPT_PREFIX: Final[str] = (
+    "You're a friendly cafe staff member. Listen to what the customer wants and help them "
+    "in a warm, natural way. If they want to order food, make a reservation, or just ask questions, "
+    "respond conversationally like you're having a real conversation with a regular customer.\n\n"
+    "Our Menu Today:\n"
+)
+_INTENT_PROMPT_SUFFIX: Final[str] = (
+    "\n\n"
+    "GUIDELINES:\n"
+    "- If they want to order food → use intent_is_order\n"
+    "- If they want to make a reservation → use intent_is_reservation\n"
+    "- Answer simple questions about menu/hours yourself\n"
+    "- Use the shared tools to capture customer information\n"
+    "- Be warm and welcoming, especially to returning customers"
+)
+
+
 class IntentClassifierAgent(BaseRestaurantAgent):
     def __init__(self, chat_ctx, firebase, userdata: UserData, config: AgentConfig):
         super().__init__(chat_ctx, firebase, userdata, config)
@@ -215,18 +231,7 @@ class IntentClassifierAgent(BaseRestaurantAgent):
         # Get menu information from Firebase
         menu_text = firebase.get_menu_text()
         
-        self.instructions = (
-            f"You're a friendly cafe staff member. Listen to what the customer wants and help them "
-            f"in a warm, natural way. If they want to order food, make a reservation, or just ask questions, "
-            f"respond conversationally like you're having a real conversation with a regular customer.\n\n"
-            f"Our Menu Today:\n{menu_text}\n\n"
-            f"GUIDELINES:\n"
-            f"- If they want to order food → use intent_is_order\n"
-            f"- If they want to make a reservation → use intent_is_reservation\n"
-            f"- Answer simple questions about menu/hours yourself\n"
-            f"- Use the shared tools to capture customer information\n"
-            f"- Be warm and welcoming, especially to returning customers"
-        )
+        self.instructions = f"{_INTENT_PROMPT_PREFIX}{menu_text}{_INTENT_PROMPT_SUFFIX}"
         
     @function_tool()
     async def intent_is_order(self, context: RunContext[UserData]):
@@ -240,6 +245,25 @@ class IntentClassifierAgent(BaseRestaurantAgent):
     
     
 
+_ORDER_PROMPT_PREFIX: Final[str] = (
+    "You're a friendly cafe staff member taking orders. Chat naturally with customers about "
+    "what they'd like to eat or drink. If you need their name or phone for the order, ask casually. "
+    "Only ask for information you actually need - don't interrogate them. Be conversational and helpful, "
+    "like you're talking to a neighbor who stopped by for coffee.\n\n"
+    "Our Menu Today:\n"
+)
+_ORDER_PROMPT_SUFFIX: Final[str] = (
+    "\n\n"
+    "GUIDELINES:\n"
+    "- Help customers choose from our available menu items\n"
+    "- Ask about quantity and any modifications\n"
+    "- Use shared tools to collect customer info (name, phone)\n"
+    "- When order is complete, use finalize_order to proceed to confirmation\n"
+    "- Suggest popular items if customers seem unsure\n"
+    "- Mention loyalty points for returning customers"
+)
+
+
 class OrderAgent(BaseRestaurantAgent):
     def __init__(self, chat_ctx, firebase, userdata: UserData, config: AgentConfig):
         super().__init__(chat_ctx, firebase, userdata, config)
@@ -247,20 +271,7 @@ class OrderAgent(BaseRestaurantAgent):
         # Get menu information from Firebase
         menu_text = firebase.get_menu_text()
         
-        self.instructions = (
-            f"You're a friendly cafe staff member taking orders. Chat naturally with customers about "
-            f"what they'd like to eat or drink. If you need their name or phone for the order, ask casually. "
-            f"Only ask for information you actually need - don't interrogate them. Be conversational and helpful, "
-            f"like you're talking to a neighbor who stopped by for coffee.\n\n"
-            f"Our Menu Today:\n{menu_text}\n\n"
-            f"GUIDELINES:\n"
-            f"- Help customers choose from our available menu items\n"
-            f"- Ask about quantity and any modifications\n"
-            f"- Use shared tools to collect customer info (name, phone)\n"
-            f"- When order is complete, use finalize_order to proceed to confirmation\n"
-            f"- Suggest popular items if customers seem unsure\n"
-            f"- Mention loyalty points for returning customers"
-        )
+        self.instructions = f"{_ORDER_PROMPT_PREFIX}{menu_text}{_ORDER_PROMPT_SUFFIX}"
 
     @function_tool()
     async def add_item(self, context: RunContext[UserData], item: str, quantity: int):
@@ -16,6 +16,8 @@ class AgentConfig:
     
     # Optional fields with defaults - must come after required fields
     openai_model: str = "gpt-4o-mini"
+    openai_temperature: float = 0.5
+    openai_max_completion_tokens: int = 120  # Voice replies are short; cap for lower latency
     cartesia_voice_id: Optional[str] = None
     vad_model: str = "silero"
     firebase_service_account_path: str = "service.json"
@@ -42,6 +44,8 @@ def load_config() -> AgentConfig:
     
     # Optional configurations with defaults
     openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    openai_temperature = float(os.getenv("OPENAI_TEMPERATURE", "0.5"))
+    openai_max_completion_tokens = int(os.getenv("OPENAI_MAX_COMPLETION_TOKENS", "120"))
     cartesia_voice_id = os.getenv("CARTESIA_VOICE_ID")
     firebase_service_account = os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", "service.json")
     
@@ -57,6 +61,8 @@ def load_config() -> AgentConfig:
     return AgentConfig(
         openai_api_key=openai_api_key,
         openai_model=openai_model,
+        openai_temperature=openai_temperature,
+        openai_max_completion_tokens=openai_max_completion_tokens,
         deepgram_api_key=deepgram_api_key,
         cartesia_api_key=cartesia_api_key,
         cartesia_voice_id=cartesia_voice_id,
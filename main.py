@@ -1,17 +1,30 @@
 # main.py - LiveKit Restaurant Assistant Entrypoint with SIP Support
+import asyncio
 import logging
 
-from livekit.agents import JobContext, WorkerOptions, AgentSession, cli, AutoSubscribe, Worker
-from livekit.plugins import groq
+from livekit.agents import JobContext, JobProcess, WorkerOptions, AgentSession, cli, AutoSubscribe, Worker
+from livekit.plugins import groq, openai, deepgram, cartesia
 from app.models.restaurant import UserData
-from manager import FirebaseManager
-from assistant import IntentClassifierAgent
+from manager import FirebaseManager, get_firebase
+from assistant import IntentClassifierAgent, get_vad
 from config import load_config, validate_config
 from error_handlers import RestaurantErrorHandler, SipCallHandler
 
 logger = logging.getLogger(__name__)
 
 
+def prewarm(proc: JobProcess):
+    """Load the VAD model while the process is idle so calls don't wait on it"""
+    get_vad()
+
+
+def start_firebase(credentials_path: str) -> FirebaseManager:
+    """Get the shared Firebase manager and wait for the first menu snapshot"""
+    firebase = get_firebase(credentials_path)
+    firebase.watch_menu_items()
+    return firebase
+
+
 async def entrypoint(ctx: JobContext):
     """Main entrypoint for the restaurant assistant with SIP support"""
     
@@ -21,8 +34,18 @@ async def entrypoint(ctx: JobContext):
         if not validate_config(config):
             raise ValueError("Invalid configuration - check your API keys")
 
-        # Initialize Firebase manager
-        firebase = FirebaseManager(config.firebase_service_account_path)
+        # Initialize Firebase manager and menu listener in a thread while connecting to room
+        # (LiveKit automatically handles SIP vs web differences)
+        firebase, _ = await asyncio.gather(
+            asyncio.to_thread(start_firebase, config.firebase_service_account_path),
+            ctx.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY),
+        )
+        
+        async def stop_menu_watch():
+            firebase.stop_watching_menu()
+        
+        ctx.add_shutdown_callback(stop_menu_watch)
+        logger.info(f"🔗 Connected to room: {ctx.room.name}")
         
         # Initialize error handlers
         error_handler = RestaurantErrorHandler(firebase)
@@ -58,12 +81,22 @@ async def entrypoint(ctx: JobContext):
             config=config
         )
 
-        # Start the agent session
-        session = AgentSession[UserData](userdata=userdata)
-
-        # Connect to room (LiveKit automatically handles SIP vs web differences)
-        await ctx.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY)
-        logger.info(f"🔗 Connected to room: {ctx.room.name}")
+        # Start the agent session; its STT, LLM, TTS and VAD are shared by every agent in this call
+        session = AgentSession[UserData](
+            userdata=userdata,
+            stt=deepgram.STT(api_key=config.deepgram_api_key),
+            llm=openai.LLM(
+                model=config.openai_model,
+                api_key=config.openai_api_key,
+                temperature=config.openai_temperature,
+                max_completion_tokens=config.openai_max_completion_tokens
+            ),
+            tts=cartesia.TTS(
+                api_key=config.cartesia_api_key,
+                voice=config.cartesia_voice_id
+            ),
+            vad=get_vad(),
+        )
 
         # Start the agent session with error handling
         try:
@@ -119,6 +152,7 @@ if __name__ == "__main__":
     # Configure CLI options for SIP support
     cli.run_app(WorkerOptions(
         entrypoint_fnc=entrypoint,
+        prewarm_fnc=prewarm,
         load_fnc=calculate_worker_load,
         num_idle_processes=2,  # Keep 2 processes warm
         load_threshold=0.8,  # Mark as unavailable at 80% load
@@ -1,6 +1,9 @@
+from collections import defaultdict
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 import uuid
 import asyncio
 
@@ -13,6 +16,11 @@ from app.models.restaurant import CustomerOrder, MenuItem, UserData
 # LOGGER = logging.getLogger(__name__)
 logger = logging.getLogger(__name__)
 
+# Reload the menu in the background after this long without a healthy listener
+MENU_CACHE_TTL_SECONDS = 300
+# How long watch_menu_items() waits for the listener's first snapshot
+MENU_WATCH_TIMEOUT_SECONDS = 10
+
 class FirebaseManager:
     """Handles all Firebase operations for the restaurant"""
     
@@ -20,8 +28,9 @@ class FirebaseManager:
         """Initialize Firebase Admin SDK"""
         try:
             # Initialize Firebase Admin
-            cred = credentials.Certificate(credentials_path)
-            firebase_admin.initialize_app(cred)
+            if not firebase_admin._apps:
+                cred = credentials.Certificate(credentials_path)
+                firebase_admin.initialize_app(cred)
             
             # Get Firestore client
             self.db = firestore.client()
@@ -35,44 +44,147 @@ class FirebaseManager:
             
             # In-memory menu cache for faster access
             self.menu_items = {}
-            
+            # Formatted menu text paired with the menu dict it was built from;
+            # a stale pair is detected by identity, so readers need no lock
+            self._menu_text: Optional[Tuple[Dict, str]] = None
+            self._menu_loaded_at = 0.0
+            self._menu_snapshot_at = 0.0
+            # Guards menu writes from the listener, refresh and caller threads
+            self._menu_lock = threading.Lock()
+            # Realtime listener handle shared by watch_menu_items() subscribers
+            self._menu_watch = None
+            self._menu_watchers = 0
+            self._menu_synced = threading.Event()
+            self._menu_refreshing = False
+            
+            # Menu is filled by load_menu() or pushed by watch_menu_items()
             logger.info("Firebase initialized successfully")
             
-            # Load menu items into memory asynchronously
-            self._load_menu()
-            
         except Exception as e:
             logger.error(f"Firebase initialization failed: {e}")
             raise
 
-    def _load_menu(self):
-        """Load menu items into memory for faster access"""
+    def _available_menu_query(self):
+        """Query for available menu items, shared by loads and the listener"""
+        return self.menu_collection.where(filter=FieldFilter("available", "==", True))
+
+    def load_menu(self):
+        """Load menu items into memory (blocking, so keep it off the event loop)"""
+        started_at = time.time()
         try:
-            docs = self.menu_collection.where('available', '==', True).stream()
-            self.menu_items = {doc.id: doc.to_dict() for doc in docs}
-            logger.info(f"Loaded {len(self.menu_items)} menu items into memory")
+            docs = self._available_menu_query().stream()
+            menu_items = {doc.id: doc.to_dict() for doc in docs}
         except Exception as e:
+            # Back off until the TTL expires instead of retrying on every call
+            self._menu_loaded_at = time.time()
             logger.error(f"Error loading menu: {e}")
+            return
+        
+        with self._menu_lock:
+            # A snapshot that arrived while we were reading is at least as fresh
+            if self._menu_snapshot_at >= started_at:
+                logger.info("Discarding menu load superseded by a realtime snapshot")
+                return
+            self._set_menu_items(menu_items)
+        logger.info(f"Loaded {len(menu_items)} menu items into memory")
+
+    def _set_menu_items(self, menu_items: Dict[str, Dict]):
+        """Replace the in-memory menu with a single atomic rebind (hold _menu_lock)"""
+        self.menu_items = menu_items
+        self._menu_loaded_at = time.time()
+
+    def watch_menu_items(self):
+        """Subscribe to realtime menu updates; the listener is shared and reference counted.
+        
+        Blocks until the first snapshot has filled the menu, falling back to a direct
+        load after MENU_WATCH_TIMEOUT_SECONDS, so call it from a thread inside the event loop.
+        Every call must be paired with stop_watching_menu().
+        """
+        with self._menu_lock:
+            self._menu_watchers += 1
+            if self._menu_watch is None:
+                try:
+                    self._menu_watch = self._available_menu_query().on_snapshot(self._on_menu_snapshot)
+                    logger.info("Watching menu items for changes")
+                except Exception as e:
+                    logger.error(f"Error watching menu items: {e}")
+        
+        if self._menu_watch is None or not self._menu_synced.wait(MENU_WATCH_TIMEOUT_SECONDS):
+            logger.warning("No menu snapshot received, loading menu directly")
+            self.load_menu()
+
+    def stop_watching_menu(self):
+        """Release a watch_menu_items() subscription; the listener closes with the last one"""
+        with self._menu_lock:
+            if self._menu_watchers == 0:
+                return
+            self._menu_watchers -= 1
+            if self._menu_watchers or self._menu_watch is None:
+                return
+            watch, self._menu_watch = self._menu_watch, None
+            self._menu_synced.clear()
+        
+        try:
+            watch.unsubscribe()
+            logger.info("Stopped watching menu items")
+        except Exception as e:
+            logger.error(f"Error stopping menu watch: {e}")
+
+    def _on_menu_snapshot(self, docs, changes, read_time):
+        """Apply a menu snapshot pushed by Firestore (runs on the listener thread)"""
+        with self._menu_lock:
+            self._menu_snapshot_at = time.time()
+            self._set_menu_items({doc.id: doc.to_dict() for doc in docs})
+        self._menu_synced.set()
+        logger.info(f"Menu updated: {len(changes)} changes, {len(self.menu_items)} items available")
+
+    def _menu_is_stale(self) -> bool:
+        """Only poll when no healthy realtime listener is keeping the menu current"""
+        watch = self._menu_watch
+        if watch is not None and watch.is_active:
+            return False
+        return time.time() - self._menu_loaded_at > MENU_CACHE_TTL_SECONDS
+
+    def _refresh_menu_in_background(self):
+        """Reload the menu on a worker thread so event loop callers never block"""
+        with self._menu_lock:
+            if self._menu_refreshing:
+                return
+            self._menu_refreshing = True
+        threading.Thread(target=self._refresh_menu, name="menu-refresh", daemon=True).start()
+
+    def _refresh_menu(self):
+        try:
+            self.load_menu()
+        finally:
+            self._menu_refreshing = False
 
     def get_menu_text(self) -> str:
-        """Get formatted menu text for agent instructions"""
-        if not self.menu_items:
+        """Get formatted menu text for agent instructions (never blocks on Firestore)"""
+        if self._menu_is_stale():
+            self._refresh_menu_in_background()
+        
+        menu_items = self.menu_items
+        cached = self._menu_text
+        if cached is None or cached[0] is not menu_items:
+            cached = self._menu_text = (menu_items, self._build_menu_text(menu_items))
+        return cached[1]
+
+    def _build_menu_text(self, menu_items: Dict[str, Dict]) -> str:
+        """Format menu items grouped by category"""
+        if not menu_items:
             return "Menu currently unavailable"
         
-        menu_by_category = {}
-        for item in self.menu_items.values():
-            category = item.get('category', 'other')
-            if category not in menu_by_category:
-                menu_by_category[category] = []
-            menu_by_category[category].append(item)
+        menu_by_category = defaultdict(list)
+        for item in menu_items.values():
+            menu_by_category[item.get('category', 'other')].append(item)
         
-        menu_text = ""
+        parts = []
         for category, items in menu_by_category.items():
-            menu_text += f"\n{category.upper()}:\n"
-            for item in items:
-                menu_text += f"- {item['name']}: ${item['price']} - {item['description']}\n"
+            parts.append(f"\n{category.upper()}:\n")
+            parts.extend(f"- {item['name']}: ${item['price']} - {item['description']}\n" for item in items)
         
-        return menu_text
+        return "".join(parts)
     
     
     async def get_menu_items(self, category: Optional[str] = None, available_only: bool = True) -> List[MenuItem]:
@@ -135,6 +247,10 @@ class FirebaseManager:
             })
             logger.info(f"Updated availability for item {item_id}: {available}")
             
+            # Refresh the in-memory menu so agents pick up the change
+            if self._menu_watch is None:
+                self.load_menu()
+            
         except Exception as e:
             logger.error(f"Error updating item availability: {e}")
             
@@ -327,4 +443,24 @@ class FirebaseManager:
                 
         except Exception as e:
             logger.error(f"Error getting daily stats: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+
+# Process-wide manager so every entrypoint shares one Firestore client
+_instance: Optional[FirebaseManager] = None
+_instance_path: Optional[str] = None
+_instance_lock = threading.Lock()
+
+
+def get_firebase(credentials_path: str) -> FirebaseManager:
+    """Return the shared FirebaseManager, creating it on first use"""
+    global _instance, _instance_path
+    with _instance_lock:
+        if _instance is None:
+            _instance = FirebaseManager(credentials_path)
+            _instance_path = credentials_path
+        elif credentials_path != _instance_path:
+            logger.warning(
+                f"Firebase already initialized with {_instance_path}, ignoring credentials {credentials_path}"
+            )
+        return _instance
@@ -10,11 +10,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import asyncio
 import argparse
 from datetime import datetime
-from manager import FirebaseManager
+from manager import get_firebase
 
 class MenuManager:
     def __init__(self):
-        self.firebase = FirebaseManager(os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", "service.json"))
+        self.firebase = get_firebase(os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", "service.json"))
     
     async def list_items(self):
         """List all menu items"""
@@ -58,7 +58,7 @@ class MenuManager:
             print(f"✅ Added '{name}' with ID: {doc_ref.id}")
             
             # Reload menu cache
-            await self.firebase._load_menu()
+            self.firebase.load_menu()
             
         except Exception as e:
             print(f"❌ Error adding item: {e}")
@@ -78,7 +78,7 @@ class MenuManager:
                 print(f"❌ Item '{item_name}' not found")
             else:
                 # Reload menu cache
-                await self.firebase._load_menu()
+                self.firebase.load_menu()
                 
         except Exception as e:
             print(f"❌ Error removing item: {e}")
@@ -102,7 +102,7 @@ class MenuManager:
                 print(f"❌ Item '{item_name}' not found")
             else:
                 # Reload menu cache
-                await self.firebase._load_menu()
+                self.firebase.load_menu()
                 
         except Exception as e:
             print(f"❌ Error toggling availability: {e}")
@@ -8,7 +8,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from datetime import datetime
-from manager import FirebaseManager
+from manager import get_firebase
 
 # Simple menu data for quick seeding
 QUICK_MENU = [
@@ -67,7 +67,7 @@ QUICK_MENU = [
 async def quick_seed():
     """Quick seed with basic menu items"""
     try:
-        firebase = FirebaseManager(os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", "service.json"))
+        firebase = get_firebase(os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", "service.json"))
         
         print("Adding basic menu items...")
         for item in QUICK_MENU:
@@ -76,7 +76,7 @@ async def quick_seed():
             print(f"✅ Added {item['name']} with ID: {doc_id}")
         
         # Reload menu
-        await firebase._load_menu()
+        firebase.load_menu()
         print(f"\n🎉 Successfully added {len(QUICK_MENU)} menu items!")
         
     except Exception as e:
@@ -8,7 +8,7 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import List, Dict
-from manager import FirebaseManager
+from manager import FirebaseManager, get_firebase
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -404,7 +404,7 @@ def main():
     
     try:
         # Initialize Firebase Manager
-        firebase_manager = FirebaseManager("service.json")
+        firebase_manager = get_firebase("service.json")
         
         # Create seeder
         seeder = MenuSeeder(firebase_manager)
@@ -441,6 +441,7 @@ def main():
         # Display results
         print("\n✅ Menu seeding completed successfully!")
         print(f"📋 Menu preview:")
+        firebase_manager.load_menu()
         menu_text = firebase_manager.get_menu_text()
         print(menu_text[:500] + "..." if len(menu_text) > 500 else menu_text)
         
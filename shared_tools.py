@@ -8,6 +8,15 @@ from app.models.restaurant import UserData
 
 logger = logging.getLogger(__name__)
 
+# Customer detail patterns shared with the agents: *_SEARCH_RE finds values
+# inside free text, *_RE validates a whole string
+_PHONE_PATTERN = r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+PHONE_SEARCH_RE = re.compile('(' + _PHONE_PATTERN + ')')
+EMAIL_SEARCH_RE = re.compile('(' + _EMAIL_PATTERN + ')')
+PHONE_RE = re.compile('^' + _PHONE_PATTERN + '$')
+EMAIL_RE = re.compile('^' + _EMAIL_PATTERN + '$')
+
 @function_tool()
 async def update_customer_name(
     name: Annotated[str, Field(description="Customer's full name")],
@@ -72,8 +81,7 @@ async def update_customer_email(
 ) -> str:
     """Update customer email address"""
     # Basic email validation
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if re.match(email_pattern, email.strip()):
+    if EMAIL_RE.match(email.strip()):
         context.userdata.customer_email = email.strip().lower()
         return f"Email updated to {context.userdata.customer_email}"
     else: